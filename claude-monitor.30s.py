@@ -39,6 +39,7 @@ the uv tool venv and adds it to sys.path so imports work regardless
 of which Python SwiftBar invokes.
 """
 
+import bisect
 import json
 import os
 import sys
@@ -49,8 +50,24 @@ from pathlib import Path
 # When installed via `uv tool install claude-monitor`, the package lives in
 # ~/.local/share/uv/tools/claude-monitor/lib/python*/site-packages/
 # SwiftBar runs with the system python which can't see that, so we add it.
+# The resolved site-packages path is cached so later runs skip the probe import
+# and the directory scan; a spec lookup still lets a regular install win.
+UV_PATH_CACHE = Path.home() / ".claude-monitor" / "uv-path.cache"
+
+
 def _setup_uv_tool_path():
     """Add uv tool site-packages to sys.path if claude_monitor isn't importable."""
+    try:
+        cached = UV_PATH_CACHE.read_text().strip()
+    except OSError:
+        cached = ""
+    if cached and os.path.isdir(os.path.join(cached, "claude_monitor")):
+        import importlib.util
+
+        if importlib.util.find_spec("claude_monitor") is None:
+            sys.path.insert(0, cached)
+        return
+
     try:
         import claude_monitor  # noqa: F401
         return  # already importable, nothing to do
@@ -69,6 +86,11 @@ def _setup_uv_tool_path():
     for pydir in sorted(lib_dir.glob("python*/site-packages"), reverse=True):
         if pydir.is_dir():
             sys.path.insert(0, str(pydir))
+            try:
+                UV_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+                UV_PATH_CACHE.write_text(str(pydir))
+            except OSError:
+                pass
             return
 
 
@@ -92,23 +114,41 @@ MONO_FONT = "SFMono-Regular"
 BODY_SIZE = 12
 SMALL_SIZE = 11
 
+# --- Precomputed SwiftBar style suffixes ---
+_TITLE_SUFFIX = f"font={TITLE_FONT} size={TITLE_SIZE} offset={TITLE_OFFSET}"
+_BODY_SUFFIX = f"font={MONO_FONT} size={BODY_SIZE}"
+_SMALL_SUFFIX = f"font={MONO_FONT} size={SMALL_SIZE}"
+_HEADER_BODY = f"| color={COLOR_WHITE} {_BODY_SUFFIX}"
+_DIM_BODY = f"| color={COLOR_DIM} {_BODY_SUFFIX}"
+_DIM_SMALL = f"| color={COLOR_DIM} {_SMALL_SUFFIX}"
+_LABEL_SMALL = f"| color={COLOR_LABEL} {_SMALL_SUFFIX}"
+_RED_BODY = f"| color={COLOR_RED} {_BODY_SUFFIX}"
+_RED_SMALL = f"| color={COLOR_RED} {_SMALL_SUFFIX}"
+
+
+# Usage % thresholds and the color for each bucket (below 50, 50-80, 80-95, 95+)
+_THRESH = (50, 80, 95)
+_COLORS = (COLOR_GREEN, COLOR_YELLOW, COLOR_ORANGE, COLOR_RED)
+
 
 def get_color(pct: float) -> str:
     """Return a hex color based on usage percentage."""
-    if pct >= 95:
-        return COLOR_RED
-    if pct >= 80:
-        return COLOR_ORANGE
-    if pct >= 50:
-        return COLOR_YELLOW
-    return COLOR_GREEN
+    return _COLORS[bisect.bisect_right(_THRESH, pct)]
+
+
+def _bar_table(width: int) -> tuple:
+    """Precompute every fill level of a bar of the given width."""
+    return tuple("\u2588" * i + "\u2591" * (width - i) for i in range(width + 1))
+
+
+_BAR_TABLES = {10: _bar_table(10), 16: _bar_table(16)}
 
 
 def bar_graph(pct: float, width: int = 10) -> str:
     """Create a minimal bar using unicode block characters."""
+    table = _BAR_TABLES.get(width) or _bar_table(width)
     filled = int(pct / 100 * width)
-    filled = min(filled, width)
-    return "\u2588" * filled + "\u2591" * (width - filled)
+    return table[max(0, min(filled, width))]
 
 
 def fmt_number(n: int) -> str:
@@ -145,9 +185,11 @@ def fmt_time(dt: datetime) -> str:
     return local.strftime("%-I:%M %p")
 
 
-VALID_PLANS = ("pro", "max5", "max20", "custom")
+# PLAN_LABELS keeps menu order; VALID_PLANS is for membership checks
 PLAN_LABELS = {"pro": "Pro", "max5": "Max 5", "max20": "Max 20", "custom": "Custom"}
+VALID_PLANS = frozenset(PLAN_LABELS)
 CONFIG_PATH = Path.home() / ".claude-monitor" / "widget-config.json"
+SCRIPT_PATH = os.path.realpath(__file__)  # resolved once; used as the bash= callback
 
 # Display metrics — each can be toggled on/off independently
 DISPLAY_METRICS = (
@@ -157,42 +199,76 @@ DISPLAY_METRICS = (
     ("msg", "Messages"),
     ("msg_pct", "Message %"),
 )
+VALID_METRIC_KEYS = frozenset(k for k, _ in DISPLAY_METRICS)
 DEFAULT_DISPLAY = ["token_pct", "cost"]
 
+_config_cache = None
 
-def get_plan() -> str:
-    """Get the plan type from env var, widget config, or default."""
+
+def _load_config() -> dict:
+    """Read the widget config file once per process and cache the result."""
+    global _config_cache
+    if _config_cache is None:
+        try:
+            config = json.loads(CONFIG_PATH.read_bytes())
+        except Exception:
+            config = {}
+        _config_cache = config if isinstance(config, dict) else {}
+    return _config_cache
+
+
+# Resolved settings, filled lazily per key so each lookup only reads what it needs
+_settings_cache = {}
+
+
+def _resolve_plan(config: dict) -> str:
+    """Pick the plan from env var, widget config, last_used.json, or default."""
     # 1. Environment variable
     plan = os.environ.get("CCM_PLAN", "").lower().strip()
     if plan in VALID_PLANS:
         return plan
 
     # 2. Widget config file
-    if CONFIG_PATH.exists():
-        try:
-            with open(CONFIG_PATH) as f:
-                config = json.load(f)
-            plan = config.get("plan", "").lower().strip()
-            if plan in VALID_PLANS:
-                return plan
-        except Exception:
-            pass
+    try:
+        plan = config.get("plan", "").lower().strip()
+        if plan in VALID_PLANS:
+            return plan
+    except Exception:
+        pass
 
     # 3. LastUsedParams (plan isn't normally saved here, but check anyway)
     params_path = Path.home() / ".claude-monitor" / "last_used.json"
-    if params_path.exists():
-        try:
-            with open(params_path) as f:
-                params = json.load(f)
-            plan = params.get("plan", "").lower().strip()
-            if plan in VALID_PLANS:
-                return plan
-        except Exception:
-            pass
+    try:
+        params = json.loads(params_path.read_bytes())
+        plan = params.get("plan", "").lower().strip()
+        if plan in VALID_PLANS:
+            return plan
+    except Exception:
+        pass
 
     return "pro"
 
 
+def _resolve_display(config: dict) -> list:
+    """Pick the enabled display metrics from widget config, or default."""
+    try:
+        display = config.get("display")
+        if isinstance(display, list):
+            filtered = [d for d in display if d in VALID_METRIC_KEYS]
+            if filtered:
+                return filtered
+    except Exception:
+        pass
+    return list(DEFAULT_DISPLAY)
+
+
+def get_plan() -> str:
+    """Get the plan type from env var, widget config, or default."""
+    if "plan" not in _settings_cache:
+        _settings_cache["plan"] = _resolve_plan(_load_config())
+    return _settings_cache["plan"]
+
+
 def set_plan(plan: str) -> None:
     """Save the selected plan to the widget config file."""
     _save_config("plan", plan)
@@ -200,19 +276,9 @@ def set_plan(plan: str) -> None:
 
 def get_display() -> list:
     """Get the list of enabled display metrics from config."""
-    valid_keys = {k for k, _ in DISPLAY_METRICS}
-    if CONFIG_PATH.exists():
-        try:
-            with open(CONFIG_PATH) as f:
-                config = json.load(f)
-            display = config.get("display")
-            if isinstance(display, list):
-                filtered = [d for d in display if d in valid_keys]
-                if filtered:
-                    return filtered
-        except Exception:
-            pass
-    return list(DEFAULT_DISPLAY)
+    if "display" not in _settings_cache:
+        _settings_cache["display"] = _resolve_display(_load_config())
+    return list(_settings_cache["display"])
 
 
 def toggle_display(metric: str) -> None:
@@ -230,41 +296,43 @@ def toggle_display(metric: str) -> None:
 
 def _save_config(key: str, value) -> None:
     """Save a key-value pair to the widget config file."""
-    config = {}
-    if CONFIG_PATH.exists():
-        try:
-            with open(CONFIG_PATH) as f:
-                config = json.load(f)
-        except Exception:
-            pass
-
+    config = _load_config()
     config[key] = value
+    _settings_cache.clear()
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
     with open(CONFIG_PATH, "w") as f:
         json.dump(config, f, indent=2)
 
 
-def print_error(title: str, message: str) -> None:
-    """Print a SwiftBar error menu."""
-    print(f"CCM \u2014 | color={COLOR_GRAY} font={TITLE_FONT} size={TITLE_SIZE} offset={TITLE_OFFSET}")
-    print("---")
-    print(f"{title} | color={COLOR_RED} font={MONO_FONT} size={BODY_SIZE}")
-    print(f"{message} | color={COLOR_DIM} font={MONO_FONT} size={SMALL_SIZE}")
+def print_error(out: list, title: str, message: str) -> None:
+    """Append a SwiftBar error menu to out."""
+    out.append(f"CCM \u2014 | color={COLOR_GRAY} " + _TITLE_SUFFIX)
+    out.append("---")
+    out.append(f"{title} " + _RED_BODY)
+    out.append(f"{message} " + _DIM_SMALL)
 
 
 def main() -> None:
+    out = []
+    _render(out)
+    sys.stdout.buffer.write("\n".join(out).encode("utf-8") + b"\n")
+
+
+def _render(out: list) -> None:
+    """Build the full SwiftBar output into out, one line per entry."""
     # --- Try importing claude_monitor ---
     try:
         from claude_monitor.core.plans import Plans
         from claude_monitor.data.analysis import analyze_usage
     except ImportError:
         print_error(
+            out,
             "claude-monitor not installed",
             "Install: pip install claude-monitor",
         )
-        print("---")
-        print(
-            f"Install claude-monitor | font={MONO_FONT} size={BODY_SIZE} "
+        out.append("---")
+        out.append(
+            "Install claude-monitor | " + _BODY_SUFFIX + " "
             "bash='pip' param1='install' param2='claude-monitor' terminal=true"
         )
         return
@@ -273,15 +341,15 @@ def main() -> None:
     try:
         result = analyze_usage(hours_back=24, quick_start=True)
     except Exception as e:
-        print_error("Error loading data", str(e)[:80])
+        print_error(out, "Error loading data", str(e)[:80])
         return
 
     blocks = result.get("blocks", [])
     if not blocks:
-        print(f"CCM  Idle | color={COLOR_GRAY} font={TITLE_FONT} size={TITLE_SIZE} offset={TITLE_OFFSET}")
-        print("---")
-        print(f"No usage data found | color={COLOR_DIM} font={MONO_FONT} size={BODY_SIZE}")
-        print(f"Start a Claude Code session to see metrics | color={COLOR_DIM} font={MONO_FONT} size={SMALL_SIZE}")
+        out.append(f"CCM  Idle | color={COLOR_GRAY} " + _TITLE_SUFFIX)
+        out.append("---")
+        out.append("No usage data found " + _DIM_BODY)
+        out.append("Start a Claude Code session to see metrics " + _DIM_SMALL)
         return
 
     # --- Find active block ---
@@ -292,13 +360,13 @@ def main() -> None:
         cost = last.get("costUSD", 0.0)
         msgs = last.get("sentMessagesCount", 0)
         dur = last.get("durationMinutes", 0)
-        print(f"CCM  Idle | color={COLOR_GRAY} font={TITLE_FONT} size={TITLE_SIZE} offset={TITLE_OFFSET}")
-        print("---")
-        print(f"Last Session | color={COLOR_WHITE} font={MONO_FONT} size={BODY_SIZE}")
-        print(f"  TKN  {fmt_number(tokens):>10}     MSG  {msgs} | font={MONO_FONT} size={SMALL_SIZE} color={COLOR_DIM}")
-        print(f"  CST  {fmt_cost(cost):>10}     DUR  {fmt_duration(dur)} | font={MONO_FONT} size={SMALL_SIZE} color={COLOR_DIM}")
-        print("---")
-        _print_footer()
+        out.append(f"CCM  Idle | color={COLOR_GRAY} " + _TITLE_SUFFIX)
+        out.append("---")
+        out.append("Last Session " + _HEADER_BODY)
+        out.append(f"  TKN  {fmt_number(tokens):>10}     MSG  {msgs} " + _DIM_SMALL)
+        out.append(f"  CST  {fmt_cost(cost):>10}     DUR  {fmt_duration(dur)} " + _DIM_SMALL)
+        out.append("---")
+        _print_footer(out)
         return
 
     block = active_blocks[0]
@@ -315,98 +383,100 @@ def main() -> None:
     messages = block.get("sentMessagesCount", 0)
     duration = block.get("durationMinutes", 0)
 
-    token_pct = (tokens / token_limit * 100) if token_limit > 0 else 0
-    cost_pct = (cost / cost_limit * 100) if cost_limit > 0 else 0
-    msg_pct = (messages / msg_limit * 100) if msg_limit > 0 else 0
+    # (token, cost, message) usage percentages
+    pcts = (
+        tokens / token_limit * 100 if token_limit > 0 else 0.0,
+        cost / cost_limit * 100 if cost_limit > 0 else 0.0,
+        messages / msg_limit * 100 if msg_limit > 0 else 0.0,
+    )
+    token_pct, cost_pct, msg_pct = pcts
 
     # Use the highest percentage for color coding
-    max_pct = max(token_pct, cost_pct, msg_pct)
-    color = get_color(max_pct)
+    color = get_color(max(pcts))
 
     # --- Menu bar title (clean, label-value style) ---
     display = get_display()
-    title = _format_title(display, token_pct, cost_pct, msg_pct, cost, messages, msg_limit)
-    print(f"{title} | color={color} font={TITLE_FONT} size={TITLE_SIZE} offset={TITLE_OFFSET}")
+    title = _format_title(display, pcts, cost, messages, msg_limit)
+    out.append(f"{title} | color={color} " + _TITLE_SUFFIX)
 
     # --- Dropdown ---
-    print("---")
-    _print_plan_submenu(plan)
-    _print_display_submenu(display)
-    print("---")
+    out.append("---")
+    _print_plan_submenu(out, plan)
+    _print_display_submenu(out, display)
+    out.append("---")
 
     # --- Session metrics with bar graphs ---
-    tkn_color = get_color(token_pct)
-    cst_color = get_color(cost_pct)
-    msg_color = get_color(msg_pct)
-
-    print(f"Tokens | color={COLOR_WHITE} font={MONO_FONT} size={BODY_SIZE}")
-    print(f"  {bar_graph(token_pct, 16)}  {token_pct:.1f}% | color={tkn_color} font={MONO_FONT} size={SMALL_SIZE}")
-    print(f"  {fmt_number(tokens)} / {fmt_number(token_limit)} | color={COLOR_DIM} font={MONO_FONT} size={SMALL_SIZE}")
-    print(f"Cost | color={COLOR_WHITE} font={MONO_FONT} size={BODY_SIZE}")
-    print(f"  {bar_graph(cost_pct, 16)}  {cost_pct:.1f}% | color={cst_color} font={MONO_FONT} size={SMALL_SIZE}")
-    print(f"  {fmt_cost(cost)} / {fmt_cost(cost_limit)} | color={COLOR_DIM} font={MONO_FONT} size={SMALL_SIZE}")
-    print(f"Messages | color={COLOR_WHITE} font={MONO_FONT} size={BODY_SIZE}")
-    print(f"  {bar_graph(msg_pct, 16)}  {msg_pct:.1f}% | color={msg_color} font={MONO_FONT} size={SMALL_SIZE}")
-    print(f"  {fmt_number(messages)} / {fmt_number(msg_limit)} | color={COLOR_DIM} font={MONO_FONT} size={SMALL_SIZE}")
-    print(f"Duration | color={COLOR_WHITE} font={MONO_FONT} size={BODY_SIZE}")
-    print(f"  {fmt_duration(duration)} | color={COLOR_DIM} font={MONO_FONT} size={SMALL_SIZE}")
+    tkn_color, cst_color, msg_color = [get_color(p) for p in pcts]
+
+    out.append("Tokens " + _HEADER_BODY)
+    out.append(f"  {bar_graph(token_pct, 16)}  {token_pct:.1f}% | color={tkn_color} " + _SMALL_SUFFIX)
+    out.append(f"  {fmt_number(tokens)} / {fmt_number(token_limit)} " + _DIM_SMALL)
+    out.append("Cost " + _HEADER_BODY)
+    out.append(f"  {bar_graph(cost_pct, 16)}  {cost_pct:.1f}% | color={cst_color} " + _SMALL_SUFFIX)
+    out.append(f"  {fmt_cost(cost)} / {fmt_cost(cost_limit)} " + _DIM_SMALL)
+    out.append("Messages " + _HEADER_BODY)
+    out.append(f"  {bar_graph(msg_pct, 16)}  {msg_pct:.1f}% | color={msg_color} " + _SMALL_SUFFIX)
+    out.append(f"  {fmt_number(messages)} / {fmt_number(msg_limit)} " + _DIM_SMALL)
+    out.append("Duration " + _HEADER_BODY)
+    out.append(f"  {fmt_duration(duration)} " + _DIM_SMALL)
 
     # --- Burn rate & projections ---
     burn_rate = block.get("burnRate")
     projection = block.get("projection")
 
     if burn_rate or projection:
-        print("---")
+        out.append("---")
 
     if burn_rate:
         # Recalculate tok/min from input+output only (library includes cache tokens)
         tpm = tokens / duration if duration > 0 else 0
         cph = burn_rate.get("costPerHour", 0)
         cost_per_min = cph / 60 if cph else 0
-        print(f"Burn  {tpm:.0f} tok/min  {fmt_cost(cost_per_min)}/min | color={COLOR_LABEL} font={MONO_FONT} size={SMALL_SIZE}")
+        out.append(f"Burn  {tpm:.0f} tok/min  {fmt_cost(cost_per_min)}/min " + _LABEL_SMALL)
 
     if projection:
         remaining = projection.get("remainingMinutes", 0)
         if remaining and remaining > 0:
             exhaust_time = datetime.now(timezone.utc) + timedelta(minutes=remaining)
-            print(f"ETA   {fmt_duration(remaining)} left \u2192 {fmt_time(exhaust_time)} | color={COLOR_LABEL} font={MONO_FONT} size={SMALL_SIZE}")
+            out.append(f"ETA   {fmt_duration(remaining)} left \u2192 {fmt_time(exhaust_time)} " + _LABEL_SMALL)
 
     # --- Reset time (end of 5h block) ---
     end_time_str = block.get("endTime")
     if end_time_str:
         try:
             end_time = datetime.fromisoformat(end_time_str)
-            print(f"Reset {fmt_time(end_time)} | color={COLOR_LABEL} font={MONO_FONT} size={SMALL_SIZE}")
+            out.append(f"Reset {fmt_time(end_time)} " + _LABEL_SMALL)
         except (ValueError, TypeError):
             pass
 
     # --- Model distribution ---
     per_model = block.get("perModelStats", {})
     if per_model and tokens > 0:
-        print("---")
-        print(f"Models | color={COLOR_WHITE} font={MONO_FONT} size={BODY_SIZE}")
-        sorted_models = sorted(
-            per_model.items(),
-            key=lambda x: x[1].get("totalTokens", 0)
-            if isinstance(x[1], dict)
-            else 0,
-            reverse=True,
-        )
-        for model_name, stats in sorted_models:
-            if isinstance(stats, dict):
-                model_tokens = stats.get("input_tokens", 0) + stats.get("output_tokens", 0)
-                pct = model_tokens / tokens * 100 if tokens > 0 else 0
-                short_name = model_name
-                if len(short_name) > 22:
-                    short_name = short_name[:22] + "\u2026"
-                m_color = get_color(pct) if pct > 50 else COLOR_DIM
-                print(f"  {short_name:<24} {pct:>3.0f}% | color={m_color} font={MONO_FONT} size={SMALL_SIZE}")
+        out.append("---")
+        out.append("Models " + _HEADER_BODY)
+        # Drop non-dict entries once; (totalTokens, -index, name, stats) tuples
+        # then sort natively without a key callback, keeping perModelStats
+        # order for ties
+        sorted_models = [
+            (s.get("totalTokens", 0), -i, n, s)
+            for i, (n, s) in enumerate(per_model.items())
+            if isinstance(s, dict)
+        ]
+        sorted_models.sort(reverse=True)
+        for _, _, model_name, stats in sorted_models:
+            model_tokens = stats.get("input_tokens", 0) + stats.get("output_tokens", 0)
+            pct = model_tokens / tokens * 100  # tokens > 0 is guaranteed by the guard above
+            short_name = model_name
+            if len(short_name) > 22:
+                short_name = short_name[:22] + "\u2026"
+            m_color = get_color(pct) if pct > 50 else COLOR_DIM
+            out.append(f"  {short_name:<24} {pct:>3.0f}% | color={m_color} " + _SMALL_SUFFIX)
 
     # --- Limit warnings ---
     limit_msgs = block.get("limitMessages", [])
     if limit_msgs:
-        print("---")
-        print(f"\u26a0 Limit Reached | color={COLOR_RED} font={MONO_FONT} size={BODY_SIZE}")
+        out.append("---")
+        out.append("\u26a0 Limit Reached " + _RED_BODY)
         for lm in limit_msgs[:3]:
             ltype = lm.get("type", "unknown")
             reset = lm.get("reset_time")
@@ -417,23 +487,25 @@ def main() -> None:
                     msg += f" \u2192 resets {fmt_time(rt)}"
                 except (ValueError, TypeError):
                     pass
-            print(f"{msg} | font={MONO_FONT} size={SMALL_SIZE} color={COLOR_RED}")
+            out.append(f"{msg} " + _RED_SMALL)
 
     # --- Footer ---
-    print("---")
-    _print_footer()
+    out.append("---")
+    _print_footer(out)
 
 
 def _format_title(
     display: list,
-    token_pct: float,
-    cost_pct: float,
-    msg_pct: float,
+    pcts: tuple,
     cost: float,
     messages: int,
     msg_limit: int,
 ) -> str:
-    """Format the menu bar title — clean label + value pairs like system monitors."""
+    """Format the menu bar title — clean label + value pairs like system monitors.
+
+    pcts is the (token, cost, message) percentage tuple computed in _render.
+    """
+    token_pct, cost_pct, msg_pct = pcts
     parts = []
     for key in display:
         if key == "token_pct":
@@ -449,41 +521,37 @@ def _format_title(
     return "  ".join(parts) if parts else "CCM"
 
 
-def _print_display_submenu(current_display: list) -> None:
-    """Print display metric toggles as a SwiftBar submenu."""
-    print(f"Display | color={COLOR_WHITE} font={MONO_FONT} size={BODY_SIZE}")
-    script = os.path.realpath(__file__)
+def _print_display_submenu(out: list, current_display: list) -> None:
+    """Append display metric toggles as a SwiftBar submenu."""
+    out.append("Display " + _HEADER_BODY)
     for key, label in DISPLAY_METRICS:
         check = "\u2713 " if key in current_display else "   "
-        print(
-            f"--{check}{label} | font={MONO_FONT} size={SMALL_SIZE} bash={script} "
+        out.append(
+            f"--{check}{label} | {_SMALL_SUFFIX} bash={SCRIPT_PATH} "
             f"param1=--toggle-display param2={key} terminal=false refresh=true"
         )
 
 
-def _print_plan_submenu(current_plan: str) -> None:
-    """Print plan selector as a SwiftBar submenu."""
+def _print_plan_submenu(out: list, current_plan: str) -> None:
+    """Append plan selector as a SwiftBar submenu."""
     label = PLAN_LABELS.get(current_plan, current_plan.upper())
-    print(f"Plan: {label} | color={COLOR_WHITE} font={MONO_FONT} size={BODY_SIZE}")
-    script = os.path.realpath(__file__)
-    for plan_key in VALID_PLANS:
-        plan_label = PLAN_LABELS[plan_key]
+    out.append(f"Plan: {label} " + _HEADER_BODY)
+    for plan_key, plan_label in PLAN_LABELS.items():
         check = "\u2713 " if plan_key == current_plan else "   "
-        print(
-            f"--{check}{plan_label} | font={MONO_FONT} size={SMALL_SIZE} bash={script} "
+        out.append(
+            f"--{check}{plan_label} | {_SMALL_SUFFIX} bash={SCRIPT_PATH} "
             f"param1=--set-plan param2={plan_key} terminal=false refresh=true"
         )
 
 
-def _print_footer() -> None:
-    """Print common footer items."""
-    print(f"Open Terminal Monitor | font={MONO_FONT} size={BODY_SIZE} bash=ccm terminal=true")
-    print(f"Refresh | font={MONO_FONT} size={BODY_SIZE} refresh=true")
+def _print_footer(out: list) -> None:
+    """Append common footer items."""
+    out.append("Open Terminal Monitor | " + _BODY_SUFFIX + " bash=ccm terminal=true")
+    out.append("Refresh | " + _BODY_SUFFIX + " refresh=true")
 
 
 if __name__ == "__main__":
     # Handle config arguments (called by SwiftBar when user picks an option)
-    valid_metric_keys = {k for k, _ in DISPLAY_METRICS}
     if len(sys.argv) >= 3:
         if sys.argv[1] == "--set-plan":
             chosen = sys.argv[2].lower().strip()
@@ -492,7 +560,7 @@ if __name__ == "__main__":
             sys.exit(0)
         if sys.argv[1] == "--toggle-display":
             chosen = sys.argv[2].lower().strip()
-            if chosen in valid_metric_keys:
+            if chosen in VALID_METRIC_KEYS:
                 toggle_display(chosen)
             sys.exit(0)
 